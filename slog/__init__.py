@@ -19,10 +19,7 @@ from .utils import (
     is_dunder as is_dunder,
     capture_output as capture_output,
 )
-from .version import version_info as version_info
-
-# %% Constants
-__version__ = ".".join(str(x) for x in version_info)
+from .version import __version__ as __version__, version_info as version_info
 
 # %% Unit test
 if __name__ == "__main__":
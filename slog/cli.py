@@ -8,14 +8,21 @@ Notes
 """
 
 # %% Imports
-import doctest
+import codecs
 from pathlib import Path
 import sys
-import unittest
 
 from slog.enums import ReturnCodes
 from slog.paths import get_root_dir
-from slog.version import version_info
+
+try:
+    from slog.version import version_str
+except ImportError:  # pragma: no cover
+    version_str = "unknown"
+
+# %% Constants
+_HELP_COMMANDS = frozenset({"help", "--help", "-h"})
+_VERSION_COMMANDS = frozenset({"version", "--version", "-v"})
 
 
 # %% Functions - main
@@ -27,15 +34,15 @@ def main() -> int:
     else:
         command = "help"
     # check for alternative forms of help with the base dcs command
-    if command in {"help", "--help", "-h"}:
+    if command in _HELP_COMMANDS:
         try:
             return_code = print_help()
-        except:
+        except (OSError, UnicodeDecodeError):
             return_code = ReturnCodes.bad_help_file
-    elif command in {"version", "--version", "-v"}:
+    elif command in _VERSION_COMMANDS:
         try:
             return_code = print_version()
-        except:
+        except OSError:
             return_code = ReturnCodes.clean
     elif command == "tests":
         # run tests using pytest
@@ -61,8 +68,10 @@ def print_help(help_file: Path | None = None) -> int:
 
     Examples
     --------
-    >>> from slog import print_help
-    >>> print_help() # doctest: +SKIP
+    .. code-block:: python
+
+        from slog import print_help
+        print_help()
 
     """
     if help_file is None:
@@ -70,9 +79,14 @@ def print_help(help_file: Path | None = None) -> int:
     if not help_file.is_file():
         print(f'Warning: help file at "{help_file}" was not found.')
         return ReturnCodes.bad_help_file
-    with open(help_file, encoding="utf-8") as file:
-        text = file.read()
-    print(text)
+    data = help_file.read_bytes()
+    # write the raw bytes when possible, otherwise decode them (such as when stdout is a StringIO)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None and codecs.lookup(sys.stdout.encoding).name == "utf-8":
+        sys.stdout.flush()
+        buffer.write(data + b"\n")
+    else:
+        print(data.decode("utf-8"))
     return ReturnCodes.clean
 
 
@@ -87,21 +101,20 @@ def print_version() -> int:
 
     Examples
     --------
-    >>> from slog import print_version
-    >>> print_version()  # doctest: +SKIP
+    .. code-block:: python
+
+        from slog import print_version
+        print_version()
 
     """
-    try:
-        version = ".".join(str(x) for x in version_info)
-        return_code = ReturnCodes.clean
-    except:
-        version = "unknown"
-        return_code = ReturnCodes.bad_version
-    print(version)
-    return return_code
+    print(version_str)
+    return ReturnCodes.bad_version if version_str == "unknown" else ReturnCodes.clean
 
 
 # %% Unit test
 if __name__ == "__main__":
+    import doctest
+    import unittest
+
     unittest.main(module="slog.tests.test_cli", exit=False)
     doctest.testmod(verbose=False)
@@ -10,13 +10,11 @@ Notes
 """
 
 # %% Imports
-import doctest
 from enum import Enum, EnumMeta
 import logging
-from typing import ClassVar
-import unittest
+from typing import Any, ClassVar
 
-from slog.utils import consecutive, is_dunder
+from slog.utils import consecutive
 
 
 # %% MetaClasses - _EnumMetaPlus
@@ -24,18 +22,35 @@ class _EnumMetaPlus(EnumMeta):
     r"""
     Overrides the repr/str methods of the EnumMeta class to display all possible values.
 
-    Also makes the __getattr__ attribute error more explicit.
+    Also makes the __getattr__ attribute error more explicit, and caches the names and values, as
+    the members can't change after the class is created.
     """
 
+    _cached_names: tuple[str, ...]
+    _cached_values: tuple[int, ...]
+    _cached_min: int | None
+    _cached_max: int | None
+
+    def __new__(mcs, cls: str, bases: tuple[type, ...], classdict: Any, **kwds: Any) -> Any:
+        r"""Create the enum class and cache its member names and values."""
+        enum_class = super().__new__(mcs, cls, bases, classdict, **kwds)
+        values: tuple[int, ...] = tuple(enum_class.__members__.values())
+        type.__setattr__(enum_class, "_cached_names", tuple(enum_class.__members__))
+        type.__setattr__(enum_class, "_cached_values", values)
+        type.__setattr__(enum_class, "_cached_min", min(values) if values else None)
+        type.__setattr__(enum_class, "_cached_max", max(values) if values else None)
+        return enum_class
+
     def __repr__(cls) -> str:
-        return "\n".join((repr(field) for field in cls))  # type: ignore[var-annotated]  # pylint: disable=not-an-iterable
+        return "\n".join(map(repr, cls))
 
     def __str__(cls) -> str:
-        return "\n".join((str(field) for field in cls))  # type: ignore[var-annotated]  # pylint: disable=not-an-iterable
+        return "\n".join(map(str, cls))
 
     def __getattr__(cls, name: str) -> int:
         r"""Return the enum member matching `name`."""
-        if is_dunder(name):
+        # Note that this is an inlined copy of is_dunder, as it is called on every attribute miss
+        if len(name) > 4 and name.startswith("__") and name.endswith("__") and name[2] != "_" and name[-3] != "_":
             raise AttributeError(name)
         try:
             return cls._member_map_[name]  # type: ignore[return-value]
@@ -45,14 +60,11 @@ class _EnumMetaPlus(EnumMeta):
 
     def list_of_names(cls) -> list[str]:
         r"""Return a list of all the names within the enumerator."""
-        # look for class.name: pattern, ignore class, return names only
-        names = list(cls.__members__)
-        return names
+        return list(cls._cached_names)
 
     def list_of_values(cls) -> list[int]:
         r"""Return a list of all the values within the enumerator."""
-        values = list(cls.__members__.values())  # type: ignore[var-annotated]
-        return values
+        return list(cls._cached_values)
 
     @property
     def num_values(cls) -> int:
@@ -62,12 +74,16 @@ class _EnumMetaPlus(EnumMeta):
     @property
     def min_value(cls) -> int:
         r"""Return the minimum value of the enumerator."""
-        return min(cls.__members__.values())
+        if cls._cached_min is None:
+            raise ValueError(f'"{cls.__name__}" does not have any values.')
+        return cls._cached_min
 
     @property
     def max_value(cls) -> int:
         r"""Return the maximum value of the enumerator."""
-        return max(cls.__members__.values())
+        if cls._cached_max is None:
+            raise ValueError(f'"{cls.__name__}" does not have any values.')
+        return cls._cached_max
 
 
 # %% Classes - IntEnumPlus
@@ -157,25 +173,16 @@ class LogLevel(IntEnumPlus):
 
 
 # %% Register custom logging levels
-logging.addLevelName(LogLevel.L0, "L0")
-logging.addLevelName(LogLevel.L1, "L1")
-logging.addLevelName(LogLevel.L2, "L2")
-logging.addLevelName(LogLevel.L3, "L3")
-logging.addLevelName(LogLevel.L4, "L4")
-logging.addLevelName(LogLevel.L5, "L5")
-logging.addLevelName(LogLevel.L6, "L6")
-logging.addLevelName(LogLevel.L7, "L7")
-logging.addLevelName(LogLevel.L8, "L8")
-logging.addLevelName(LogLevel.L9, "L9")
-logging.addLevelName(LogLevel.L10, "L10")
-logging.addLevelName(LogLevel.L11, "L11")
-logging.addLevelName(LogLevel.L12, "L12")
-logging.addLevelName(LogLevel.L20, "L20")
+for _level in LogLevel:
+    logging.addLevelName(_level, _level.name)
 
 # %% Configure default logging if not already set
 logging.basicConfig(level=logging.WARNING)
 
 # %% Unit test
 if __name__ == "__main__":
+    import doctest
+    import unittest
+
     unittest.main(module="slog.tests.test_enums", exit=False)
     doctest.testmod(verbose=False)
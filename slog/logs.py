@@ -7,16 +7,92 @@ Notes
 """
 
 # %% Imports
+import atexit
 import datetime
-import doctest
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+import queue
 from typing import Any
-import unittest
 
 # %% Globals
 root_logger = logging.getLogger("")
 this_logger = logging.getLogger(__name__)
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+# values of the logging module's introspection settings from before slog disabled them, or None if it hasn't
+_saved_introspection: dict[str, Any] | None = None
+
+# %% Constants
+# logging module settings that control the per-record introspection
+_INTROSPECTION_SETTINGS = ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing")
+# default formats, and their pre-built formatters
+_LOG_FORMAT = "Log:%(levelname)s: %(message)s"
+_FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_LOG_FORMATTER = logging.Formatter(_LOG_FORMAT)
+_FILE_FORMATTER = logging.Formatter(_FILE_FORMAT)
+# format fields that require the caller, thread or process introspection to be populated
+_INTROSPECTION_FIELDS = ("%(pathname)", "%(filename)", "%(module)", "%(lineno)", "%(funcName)", "%(thread", "%(process")
+
+
+# %% Functions - _disable_caller_introspection
+def _disable_caller_introspection() -> None:
+    r"""Turn off the stack frame walk and thread/process lookups that logging does on every record."""
+    global _saved_introspection  # pylint: disable=global-statement
+    if _saved_introspection is None:
+        _saved_introspection = {key: getattr(logging, key) for key in _INTROSPECTION_SETTINGS}
+    logging._srcfile = None  # pylint: disable=protected-access
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+
+# %% Functions - _restore_caller_introspection
+def _restore_caller_introspection() -> None:
+    r"""Restore the logging module's introspection settings, if they were disabled by slog."""
+    global _saved_introspection  # pylint: disable=global-statement
+    if _saved_introspection is None:
+        return
+    for key, value in _saved_introspection.items():
+        setattr(logging, key, value)
+    _saved_introspection = None
+
+
+# %% Functions - _start_listener
+def _start_listener(handlers: list[logging.Handler]) -> None:
+    r"""Attach a queue handler to the root logger and process its records with the given handlers on a background thread."""
+    global _listener, _queue_handler  # pylint: disable=global-statement
+    # use a new queue every time, so that nothing left from a previous activation can be written to these handlers
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _queue_handler = QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+
+
+# %% Functions - _stop_listener
+def _stop_listener(*, reattach: bool = False) -> None:
+    r"""
+    Detach the queue handler and stop the background thread once it has written all the queued records.
+
+    If reattach is True, then the listener's handlers are moved onto the root logger, so that anything
+    logged afterwards (such as by other exit hooks) is still written, otherwise they are closed.
+    """
+    global _listener, _queue_handler  # pylint: disable=global-statement
+    if _listener is None:
+        return
+    # remove the queue handler first, so that nothing else gets queued after the listener has stopped
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        if reattach:
+            root_logger.addHandler(handler)
+        else:
+            handler.flush()
+            handler.close()
+    _listener = None
+    _queue_handler = None
 
 
 # %% Functions - activate_logging
@@ -28,6 +104,8 @@ def activate_logging(
     log_format: str | None = None,
     file_format: str | None = None,
     log_start: bool | str | None = None,
+    fast_records: bool = True,
+    use_queue: bool = True,
 ) -> None:
     r"""
     Set up logging based on a user specified settings file.
@@ -46,10 +124,19 @@ def activate_logging(
         Format for the file log level
     log_start : bool or str, optional
         Whether to log the time of the start, and if a string, then log the name that started it
+    fast_records : bool, optional, default is True
+        Whether to skip the caller, thread and process introspection done for every log record.  This
+        is automatically ignored if either format uses any of those fields.
+    use_queue : bool, optional, default is True
+        Whether to pass records through a queue so that the file and screen output is written on a
+        background thread instead of blocking the caller.
 
     Notes
     -----
     #.  Written by David C. Stauffer in August 2017.
+    #.  The fast_records option changes global settings within the logging module, which are restored
+        by deactivate_logging.
+    #.  When using the queue, call flush_logging to wait for all the pending records to be written.
 
     Examples
     --------
@@ -62,9 +149,9 @@ def activate_logging(
     """
     # defaults
     if log_format is None:
-        log_format = "Log:%(levelname)s: %(message)s"
+        log_format = _LOG_FORMAT
     if file_format is None:
-        file_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        file_format = _FILE_FORMAT
     if file_level is None:
         file_level = log_level
 
@@ -74,25 +161,34 @@ def activate_logging(
     # update the log level
     root_logger.setLevel(log_level)
 
-    # optionally get the default filename
-    if bool(filename):
-        if isinstance(filename, str):
-            filename = Path(filename)
+    # optionally turn off the per-record introspection if nothing will display it
+    if fast_records and not any(field in fmt for fmt in (log_format, file_format) for field in _INTROSPECTION_FIELDS):
+        _disable_caller_introspection()
 
+    # optionally get the default filename
+    handlers: list[logging.Handler] = []
+    if filename:
         # create the log file handler
-        fh = logging.FileHandler(filename)  # type: ignore[arg-type]
+        fh = logging.FileHandler(Path(filename))
         fh.setLevel(file_level)
-        fh.setFormatter(logging.Formatter(file_format))
-        root_logger.addHandler(fh)
+        fh.setFormatter(_FILE_FORMATTER if file_format == _FILE_FORMAT else logging.Formatter(file_format))
+        handlers.append(fh)
 
     # create the log stream handler
     ch = logging.StreamHandler()
     ch.setLevel(log_level)
-    ch.setFormatter(logging.Formatter(log_format))
-    root_logger.addHandler(ch)
+    ch.setFormatter(_LOG_FORMATTER if log_format == _LOG_FORMAT else logging.Formatter(log_format))
+    handlers.append(ch)
+
+    # attach the handlers, optionally behind a queue so that the I/O happens on a background thread
+    if use_queue:
+        _start_listener(handlers)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # log the starting conditions
-    if bool(log_start):
+    if log_start:
         text = f"Logging configured to level {log_level} at {datetime.datetime.now()}"
         if isinstance(log_start, str):
             text += " in " + log_start
@@ -114,21 +210,21 @@ def deactivate_logging() -> None:
     >>> deactivate_logging()
 
     """
-    # hard-coded values
-    max_handlers = 50
-    # initialize a counter to avoid infinite while loop
-    i = 0
-    # loop through and remove all the handlers
-    while root_logger.handlers and i < max_handlers:
-        handler = root_logger.handlers.pop()
+    # detach all the handlers at once
+    with logging._lock:  # type: ignore[attr-defined]  # pylint: disable=protected-access
+        handlers = root_logger.handlers[:]
+        root_logger.handlers.clear()
+    # now that nothing else can be queued, stop any background listener, which writes out the rest of the queue
+    _stop_listener()
+    # flush and close the detached handlers
+    for handler in handlers:
         handler.flush()
         handler.close()
-        root_logger.removeHandler(handler)
-        # increment the counter
-        i += 1
     # check for bad situations
-    if i == max_handlers or bool(root_logger.handlers):
+    if root_logger.handlers:
         raise ValueError("Something bad happended when trying to close the logger.")  # pragma: no cover
+    # restore any global settings that were changed by activate_logging
+    _restore_caller_introspection()
 
 
 # %% Functions - flush_logging
@@ -146,11 +242,79 @@ def flush_logging() -> None:
     >>> flush_logging()
 
     """
+    # wait for any queued records to be processed, then flush the handlers that wrote them
+    if _listener is not None:
+        _listener.queue.join()  # type: ignore[attr-defined]
+        for handler in _listener.handlers:
+            handler.flush()
     # loop through and flush all the handlers
     for handler in root_logger.handlers:
         handler.flush()
 
 
+# %% Functions - _format_int_array
+def _format_int_array(array: Any) -> list[str] | None:
+    r"""
+    Format a small 1D or 2D integer numpy array into the same lines as str(array).
+
+    Returns None when numpy's own (much slower) formatter is needed to get the exact same output,
+    such as for floats, higher dimensions, custom print options, summarized or wrapped arrays.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if (
+        type(array) is not np.ndarray  # pylint: disable=unidiomatic-typecheck
+        or array.dtype.kind not in "iu"
+        or array.ndim not in {1, 2}
+        or array.size == 0
+    ):
+        return None
+    opts = np.get_printoptions()
+    if array.size > opts["threshold"] or opts["formatter"] is not None or opts["sign"] != "-" or opts["legacy"]:
+        return None
+    # numpy right-justifies every element to the width of the longest one
+    rows = [[str(x) for x in row] for row in (array.tolist() if array.ndim == 2 else [array.tolist()])]
+    width = max(len(x) for row in rows for x in row)
+    lines = [" [" + " ".join(x.rjust(width) for x in row) + "]" for row in rows]
+    lines[0] = lines[0][1:]
+    if array.ndim == 2:
+        lines[0] = "[" + lines[0]
+        lines[-1] += "]"
+    # let numpy handle anything that it would wrap onto multiple lines
+    if any(len(line) > opts["linewidth"] for line in lines):
+        return None
+    return lines
+
+
+# %% Functions - _get_message_list
+def _get_message_list(message: Any) -> list[str]:
+    r"""Convert a single message into the list of lines to log."""
+    if isinstance(message, list):
+        # if message is already a list, then make sure everything is already a string
+        if all(isinstance(x, str) for x in message):
+            return message
+        return [str(message)]
+    if isinstance(message, str):
+        # if message is a string, then split it on every new line (keeping one line for an empty string)
+        return message.splitlines() or [""]
+    if type(message).__module__ == "numpy":
+        # if message is a simple numpy array, then format it directly without numpy's generic printer
+        lines = _format_int_array(message)
+        if lines is not None:
+            return lines
+    # otherwise, convert message to a string, and then split on every new line
+    return str(message).splitlines() or [""]
+
+
+# %% Functions - _get_all_messages
+def _get_all_messages(message: Any, *args: Any) -> list[str]:
+    r"""Convert the message and any additional arguments into a new list of all the lines to log."""
+    all_msg: list[str] = []
+    for x in (message, *args):
+        all_msg.extend(_get_message_list(x))
+    return all_msg
+
+
 # %% Functions - log_multiline
 def log_multiline(logger: logging.Logger, log_level: int, message: Any, *args: Any) -> None:
     r"""
@@ -167,6 +331,12 @@ def log_multiline(logger: logging.Logger, log_level: int, message: Any, *args: A
     args : list of additional arguments to log
         Additional options to log
 
+    Notes
+    -----
+    #.  The message and any additional arguments are only converted to strings if the logger is
+        enabled for the given level, so expensive objects (such as large numpy arrays) can be passed
+        directly without incurring any formatting cost when the level is disabled.
+
     Examples
     --------
     >>> from slog import activate_logging, deactivate_logging, log_multiline, LogLevel
@@ -179,30 +349,27 @@ def log_multiline(logger: logging.Logger, log_level: int, message: Any, *args: A
     >>> deactivate_logging()
 
     """
+    # exit early if this level is not being logged
+    if not logger.isEnabledFor(log_level):
+        return
+
+    # short-circuit the common case of a single line string with nothing else to split
+    if not args and type(message) is str and message.isprintable():  # pylint: disable=unidiomatic-typecheck
+        logger.log(log_level, message)
+        return
 
-    def _get_message_list(message: Any) -> list[str]:
-        if isinstance(message, list):
-            # if message is already a list, then make sure everything is already a string
-            if all(isinstance(x, str) for x in message):
-                return message
-            return [str(message)]
-        if isinstance(message, str):
-            # if message is a string, then split it on every new line
-            return message.split("\n")
-        # otherwise, convert message to a string, and then split on every new line
-        return str(message).split("\n")
-
-    # if there are additional arguments, then append them with the same rules
-    all_msg = _get_message_list(message)
-    if args:
-        for x in args:
-            all_msg.extend(_get_message_list(x))
     # log all the messages
-    for msg in all_msg:
+    for msg in _get_all_messages(message, *args):
         logger.log(log_level, msg)
 
 
+# %% Make sure any queued records are written on exit, and that later records still go to the handlers
+atexit.register(_stop_listener, reattach=True)
+
 # %% Unit test
 if __name__ == "__main__":
+    import doctest
+    import unittest
+
     unittest.main(module="slog.tests.test_logs", exit=False)
     doctest.testmod(verbose=False)
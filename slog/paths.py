@@ -9,18 +9,21 @@ Notes
 """
 
 # %% Imports
-import doctest
-from functools import lru_cache
+from functools import cache
 from pathlib import Path
-import unittest
 
 
 # %% Functions - get_root_dir
-@lru_cache
-def get_root_dir() -> Path:
+@cache
+def get_root_dir(resolve: bool = False) -> Path:
     r"""
     Return the folder that contains this source file and thus the root folder for the whole code.
 
+    Parameters
+    ----------
+    resolve : bool, optional, default is False
+        Whether to resolve any symlinks in the path, such as for some editable installs
+
     Returns
     -------
     class pathlib.Path
@@ -29,6 +32,8 @@ def get_root_dir() -> Path:
     Notes
     -----
     #.  Written by David C. Stauffer in March 2015.
+    #.  Only resolves the path if asked, or if it is somehow relative, as module file names are
+        already absolute, and resolving requires a file system lookup for every folder.
 
     Examples
     --------
@@ -37,12 +42,15 @@ def get_root_dir() -> Path:
     p = .../slog')
 
     """
-    # this folder is the root directory based on the location of this file (utils.py)
-    return Path(__file__).resolve().parent
+    # this folder is the root directory based on the location of this file (paths.py)
+    folder = Path(__file__).parent
+    if resolve or not folder.is_absolute():
+        folder = folder.resolve()
+    return folder
 
 
 # %% Functions - get_tests_dir
-@lru_cache
+@cache
 def get_tests_dir() -> Path:
     r"""
     Return the default test folder location.
@@ -69,5 +77,8 @@ def get_tests_dir() -> Path:
 
 # %% Unit test
 if __name__ == "__main__":
+    import doctest
+    import unittest
+
     unittest.main(module="slog.tests.test_paths", exit=False)
     doctest.testmod(verbose=False)
@@ -8,7 +8,10 @@ Notes
 """
 
 # %% Imports
+import io
+import sys
 import unittest
+from unittest.mock import patch
 
 import slog as lg
 
@@ -17,10 +20,34 @@ import slog as lg
 class Test_main(unittest.TestCase):
     r"""
     Tests the main function with the following cases:
-        TBD
+        Help
+        Version
+        Unknown command
     """
 
-    pass  # TODO: write this
+    def _run(self, *args: str) -> tuple[int, str]:
+        with patch.object(sys, "argv", ["slog", *args]):
+            with lg.capture_output() as ctx:
+                with self.assertRaises(SystemExit) as context:
+                    lg.main()
+        output = ctx.get_output()
+        ctx.close()
+        return context.exception.code, output  # type: ignore[return-value]
+
+    def test_help(self) -> None:
+        return_code, output = self._run("--help")
+        self.assertEqual(return_code, lg.ReturnCodes.clean)
+        self.assertTrue(output.startswith("####\nslog\n####\n"))
+
+    def test_version(self) -> None:
+        return_code, output = self._run("-v")
+        self.assertEqual(return_code, lg.ReturnCodes.clean)
+        self.assertEqual(output, lg.__version__)
+
+    def test_bad_command(self) -> None:
+        return_code, output = self._run("bad")
+        self.assertEqual(return_code, lg.ReturnCodes.bad_command)
+        self.assertEqual(output, 'Unknown command: "bad"')
 
 
 # %% print_help
@@ -29,6 +56,7 @@ class Test_print_help(unittest.TestCase):
     Tests the print_help function with the following cases:
         Nominal
         Specified file
+        Binary stdout
     """
 
     def test_nominal(self) -> None:
@@ -46,6 +74,14 @@ class Test_print_help(unittest.TestCase):
         ctx.close()
         self.assertTrue(output.startswith('r"""\nTest file for the `cli` module'))
 
+    def test_binary_stdout(self) -> None:
+        help_file = lg.get_tests_dir() / "test_cli.py"
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        with patch.object(sys, "stdout", stdout):
+            return_code = lg.print_help(help_file)
+        self.assertEqual(return_code, lg.ReturnCodes.clean)
+        self.assertEqual(stdout.buffer.getvalue(), help_file.read_bytes() + b"\n")
+
 
 # %% print_version
 class Test_print_version(unittest.TestCase):
@@ -8,6 +8,7 @@ Notes
 
 # %% Imports
 from enum import unique
+import logging
 from typing import ClassVar
 import unittest
 
@@ -65,6 +66,11 @@ class Test_IntEnumPlus(unittest.TestCase):
         list_of_values = _Example_Enum.list_of_values()
         self.assertEqual(list_of_values, [1, 2, 10])
 
+    def test_list_is_a_copy(self) -> None:
+        list_of_names = _Example_Enum.list_of_names()
+        list_of_names.append("field_bad")
+        self.assertEqual(_Example_Enum.list_of_names(), ["field_one", "field_two", "field_ten"])
+
     def test_num_values(self) -> None:
         num_values = _Example_Enum.num_values
         self.assertEqual(num_values, 3)
@@ -77,10 +83,31 @@ class Test_IntEnumPlus(unittest.TestCase):
         max_value = _Example_Enum.max_value
         self.assertEqual(max_value, 10)
 
+    def test_empty_min_max(self) -> None:
+        empty = lg.IntEnumPlus("Empty", [])  # type: ignore[call-overload]
+        self.assertEqual(empty.num_values, 0)
+        with self.assertRaises(ValueError) as context:
+            empty.min_value
+        self.assertEqual(str(context.exception), '"Empty" does not have any values.')
+        with self.assertRaises(ValueError) as context:
+            empty.max_value
+        self.assertEqual(str(context.exception), '"Empty" does not have any values.')
+
     def test_bad_attribute(self) -> None:
         with self.assertRaises(AttributeError):
             _Example_Enum.non_existant_field
 
+    def test_bad_dunder_attribute(self) -> None:
+        with self.assertRaises(AttributeError) as context:
+            _Example_Enum.__non_existant__
+        self.assertEqual(str(context.exception), "__non_existant__")
+
+    def test_bad_underscore_attribute(self) -> None:
+        for name in ["__", "____", "___x___"]:
+            with self.assertRaises(AttributeError) as context:
+                getattr(_Example_Enum, name)
+            self.assertEqual(str(context.exception), f'"_Example_Enum" does not have an attribute of "{name}"')
+
     def test_bad_uniqueness(self) -> None:
         with self.assertRaises(ValueError):
 
@@ -118,10 +145,13 @@ class Test_ReturnCodes(unittest.TestCase):
 class Test_LogLevel(unittest.TestCase):
     r"""
     Tests the LogLevel enumerator with the following cases:
-        TBD
+        Registered level names
     """
 
-    pass
+    def test_level_names(self) -> None:
+        for level in lg.LogLevel:
+            self.assertEqual(logging.getLevelName(level), level.name)
+            self.assertEqual(logging.getLevelName(level.name), level)
 
 
 # %% Unit test execution
@@ -8,7 +8,9 @@ Notes
 
 # %% Imports
 import logging
+from logging.handlers import QueueHandler
 import unittest
+from unittest.mock import patch
 
 import slog as lg
 
@@ -27,6 +29,15 @@ class Test_act_deact_logging(unittest.TestCase):
         Nominal
         With file output
         Flushing
+        Fast records
+        Introspection needed by format
+        Introspection set by the user
+        Queued file contents
+        Teardown order
+        New queue for each activation
+        Reattach on exit
+        Without a queue
+        Default formatters
     """
 
     def setUp(self) -> None:
@@ -60,6 +71,101 @@ class Test_act_deact_logging(unittest.TestCase):
         lines = logs.output
         self.assertEqual(len(lines), 10)
 
+    def test_fast_records(self) -> None:
+        orig_srcfile = logging._srcfile  # pylint: disable=protected-access
+        lg.activate_logging(self.level)
+        self.assertIsNone(logging._srcfile)  # pylint: disable=protected-access
+        self.assertFalse(logging.logThreads)
+        self.assertFalse(logging.logProcesses)
+        lg.deactivate_logging()
+        self.assertEqual(logging._srcfile, orig_srcfile)  # pylint: disable=protected-access
+        self.assertTrue(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+
+    def test_introspection_format(self) -> None:
+        lg.activate_logging(self.level, log_format="%(filename)s:%(lineno)d: %(message)s")
+        self.assertIsNotNone(logging._srcfile)  # pylint: disable=protected-access
+        lg.activate_logging(self.level, fast_records=False)
+        self.assertIsNotNone(logging._srcfile)  # pylint: disable=protected-access
+
+    def test_user_introspection(self) -> None:
+        orig_processes = logging.logProcesses
+        try:
+            logging.logProcesses = False
+            lg.activate_logging(self.level, fast_records=False)
+            self.assertFalse(logging.logProcesses)
+            lg.deactivate_logging()
+            self.assertFalse(logging.logProcesses)
+            lg.activate_logging(self.level)
+            lg.deactivate_logging()
+            self.assertFalse(logging.logProcesses)
+            logging.logProcesses = True
+            lg.deactivate_logging()
+            self.assertTrue(logging.logProcesses)
+        finally:
+            logging.logProcesses = orig_processes
+
+    def test_queued_file_contents(self) -> None:
+        lg.activate_logging(self.level, self.filename, log_format="%(message)s", file_format="%(levelname)s: %(message)s")
+        self.assertIsNotNone(lg.logs._listener)  # pylint: disable=protected-access
+        logger = logging.getLogger("Test")
+        for i in range(5):
+            logger.log(lg.LogLevel.L5, "Message %s", i)
+        lg.flush_logging()
+        lines = self.filename.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines, [f"L5: Message {i}" for i in range(5)])
+        lg.deactivate_logging()
+        self.assertIsNone(lg.logs._listener)  # pylint: disable=protected-access
+
+    def test_teardown_order(self) -> None:
+        lg.activate_logging(self.level, self.filename)
+        orig_stop = lg.logs._stop_listener  # pylint: disable=protected-access
+
+        def _check_stop(**kwargs: bool) -> None:
+            # the root logger must not be able to queue any more records by the time the listener stops
+            self.assertFalse(lg.logs.root_logger.handlers)
+            orig_stop(**kwargs)
+
+        with patch.object(lg.logs, "_stop_listener", _check_stop):
+            lg.deactivate_logging()
+        self.assertIsNone(lg.logs._listener)  # pylint: disable=protected-access
+
+    def test_new_queue(self) -> None:
+        lg.activate_logging(self.level)
+        queue1 = lg.logs._listener.queue  # type: ignore[union-attr]  # pylint: disable=protected-access
+        lg.activate_logging(self.level)
+        queue2 = lg.logs._listener.queue  # type: ignore[union-attr]  # pylint: disable=protected-access
+        self.assertIsNot(queue1, queue2)
+        self.assertTrue(queue1.empty())  # type: ignore[union-attr]
+
+    def test_reattach_on_exit(self) -> None:
+        lg.activate_logging(self.level, self.filename, log_format="%(message)s", file_format="%(message)s")
+        logger = logging.getLogger("Test")
+        logger.log(lg.LogLevel.L5, "Queued message")
+        lg.logs._stop_listener(reattach=True)  # pylint: disable=protected-access
+        self.assertIsNone(lg.logs._listener)  # pylint: disable=protected-access
+        handlers = lg.logs.root_logger.handlers
+        self.assertEqual(len(handlers), 2)
+        self.assertFalse(any(isinstance(handler, QueueHandler) for handler in handlers))
+        logger.log(lg.LogLevel.L5, "Message after exit")
+        lg.flush_logging()
+        lines = self.filename.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines, ["Queued message", "Message after exit"])
+
+    def test_no_queue(self) -> None:
+        lg.activate_logging(self.level, self.filename, use_queue=False)
+        self.assertIsNone(lg.logs._listener)  # pylint: disable=protected-access
+        self.assertEqual(len(lg.logs.root_logger.handlers), 2)
+        lg.deactivate_logging()
+        self.assertFalse(lg.logs.root_logger.handlers)
+
+    def test_default_formatters(self) -> None:
+        lg.activate_logging(self.level, self.filename, file_format="%(message)s", use_queue=False)
+        fh, ch = lg.logs.root_logger.handlers
+        self.assertIs(ch.formatter, lg.logs._LOG_FORMATTER)  # pylint: disable=protected-access
+        self.assertIsNot(fh.formatter, lg.logs._FILE_FORMATTER)  # pylint: disable=protected-access
+        lg.deactivate_logging()
+
     def tearDown(self) -> None:
         lg.deactivate_logging()
         self.filename.unlink(missing_ok=True)
@@ -69,7 +175,11 @@ class Test_act_deact_logging(unittest.TestCase):
 class Test_log_multiline(unittest.TestCase):
     r"""
     Tests the log_multiline function with the following cases:
-        TBD
+        Normal
+        Multi-line (x4)
+        List is not modified
+        Disabled level
+        Numpy (x4)
     """
 
     level: int
@@ -112,6 +222,30 @@ class Test_log_multiline(unittest.TestCase):
         self.assertEqual(lines[0], "L5:Test:List value:")
         self.assertEqual(lines[1], "L5:Test:[1, 2, 3]")
 
+    def test_multiline4(self) -> None:
+        with self.assertLogs(logger=self.logger, level=self.level) as logs:
+            lg.log_multiline(self.logger, self.level, "Windows\r\nline endings.\r\n", "")
+        lines = logs.output
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0], "L5:Test:Windows")
+        self.assertEqual(lines[1], "L5:Test:line endings.")
+        self.assertEqual(lines[2], "L5:Test:")
+
+    def test_list_not_modified(self) -> None:
+        message = ["Line 1", "Line 2"]
+        with self.assertLogs(logger=self.logger, level=self.level) as logs:
+            lg.log_multiline(self.logger, self.level, message, "Line 3")
+        self.assertEqual(len(logs.output), 3)
+        self.assertEqual(message, ["Line 1", "Line 2"])
+
+    def test_disabled(self) -> None:
+        class _NoStr:
+            def __str__(self) -> str:
+                raise AssertionError("Should not be converted to a string.")  # pragma: no cover
+
+        with self.assertNoLogs(logger=self.logger, level=self.level):
+            lg.log_multiline(self.logger, lg.LogLevel.L10, "Not logged.", _NoStr())
+
     @unittest.skipIf(not HAVE_NUMPY, "Skipping due to missing numpy dependency.")
     def test_numpy1(self) -> None:
         with self.assertLogs(logger=self.logger, level=self.level) as logs:
@@ -133,6 +267,26 @@ class Test_log_multiline(unittest.TestCase):
         self.assertEqual(lines[2], "L5:Test: [4 5 6]")
         self.assertEqual(lines[3], "L5:Test: [7 8 9]]")
 
+    @unittest.skipIf(not HAVE_NUMPY, "Skipping due to missing numpy dependency.")
+    def test_numpy3(self) -> None:
+        data = np.array([-1, 20, 300])
+        with self.assertLogs(logger=self.logger, level=self.level) as logs:
+            lg.log_multiline(self.logger, self.level, data, data.reshape(3, 1))
+        lines = logs.output
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0], "L5:Test:" + str(data))
+        self.assertEqual(lines[0], "L5:Test:[ -1  20 300]")
+        self.assertEqual(lines[1:], ["L5:Test:" + x for x in str(data.reshape(3, 1)).split("\n")])
+
+    @unittest.skipIf(not HAVE_NUMPY, "Skipping due to missing numpy dependency.")
+    def test_numpy4(self) -> None:
+        data = np.array([[1.5, 2.0], [-3.25, 4.0]])
+        with self.assertLogs(logger=self.logger, level=self.level) as logs:
+            lg.log_multiline(self.logger, self.level, data, np.arange(100))
+        lines = logs.output
+        exp = str(data).split("\n") + str(np.arange(100)).split("\n")
+        self.assertEqual(lines, ["L5:Test:" + x for x in exp])
+
     @classmethod
     def tearDownClass(cls) -> None:
         lg.deactivate_logging()
@@ -8,7 +8,6 @@ Notes
 """
 
 # %% Imports
-import inspect
 import os
 import pathlib
 import unittest
@@ -21,15 +20,21 @@ class Test_get_root_dir(unittest.TestCase):
     r"""
     Tests the get_root_dir function with the following cases:
         call the function
+        resolved
     """
 
     def test_function(self) -> None:
-        filepath = inspect.getfile(lg.get_root_dir.__wrapped__)
+        filepath = lg.paths.__file__
         expected_root = pathlib.Path(os.path.split(filepath)[0])
         folder = lg.get_root_dir()
         self.assertEqual(folder, expected_root)
         self.assertTrue(folder.is_dir())
 
+    def test_resolved(self) -> None:
+        folder = lg.get_root_dir(resolve=True)
+        self.assertEqual(folder, lg.get_root_dir().resolve())
+        self.assertTrue(folder.is_absolute())
+
 
 # %% get_tests_dir
 class Test_get_tests_dir(unittest.TestCase):
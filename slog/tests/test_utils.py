@@ -8,37 +8,16 @@ Notes
 """
 
 # %% Imports
-import inspect
 from io import StringIO
 import os
 import pathlib
 import sys
-from types import TracebackType
-from typing import AnyStr, ClassVar, Iterable, Iterator, TextIO, Type
 import unittest
 
 import slog as lg
 
 
-class _Example_Consecutive(lg.IntEnumPlus):
-    zero: ClassVar[int] = 0
-    one: ClassVar[int] = 1
-    two: ClassVar[int] = 2
-
-
-class _Example_Consecutive2(lg.IntEnumPlus):
-    zero: ClassVar[int] = 0
-    one: ClassVar[int] = 1
-    skip: ClassVar[int] = 9
-
-
-class _Example_Consecutive3(lg.IntEnumPlus):
-    zero: ClassVar[int] = 0
-    one: ClassVar[int] = 1
-    dup: ClassVar[int] = 0
-
-
-class _ExampleTextIOClass(TextIO):
+class _ExampleTextIOClass:
     def __init__(self) -> None:
         self._text: list[str] = []
 
@@ -52,56 +31,6 @@ class _ExampleTextIOClass(TextIO):
     def readlines(self, hint: int = 0) -> list[str]:
         return self._text[hint:]
 
-    def __enter__(self) -> TextIO:  # type: ignore[empty-body]
-        pass
-
-    def fileno(self) -> int:  # type: ignore[empty-body]
-        pass
-
-    def flush(self) -> None:
-        pass
-
-    def isatty(self) -> bool:  # type: ignore[empty-body]
-        pass
-
-    def read(self, n: int = ...) -> AnyStr:  # type: ignore[empty-body, type-var]
-        pass
-
-    def readable(self) -> bool:  # type: ignore[empty-body]
-        pass
-
-    def readline(self, limit: int = ...) -> AnyStr:  # type: ignore[empty-body, type-var]
-        pass
-
-    def seek(self, offset: int, whence: int = ...) -> int:  # type: ignore[empty-body]
-        pass
-
-    def seekable(self) -> bool:  # type: ignore[empty-body]
-        pass
-
-    def tell(self) -> int:  # type: ignore[empty-body]
-        pass
-
-    def truncate(self, size: int | None = ...) -> int:  # type: ignore[empty-body]
-        pass
-
-    def writable(self) -> bool:  # type: ignore[empty-body]
-        pass
-
-    def writelines(self, lines: Iterable[AnyStr]) -> None:
-        pass
-
-    def __next__(self) -> AnyStr:  # type: ignore[empty-body, type-var]
-        pass
-
-    def __iter__(self) -> Iterator[AnyStr]:  # type: ignore[empty-body]
-        pass
-
-    def __exit__(  # type: ignore[override]
-        self, t: Type[BaseException] | None, value: BaseException | None, traceback: TracebackType | None
-    ) -> bool | None:
-        pass
-
 
 # %% CaptureOutputResult
 class Test_CaptureOutputResult(unittest.TestCase):
@@ -146,11 +75,17 @@ class Test_CaptureOutputResult(unittest.TestCase):
         self.assertEqual(output, "")
         self.assertEqual(error, exp)
 
+    def test_slots(self) -> None:
+        ctx = lg.CaptureOutputResult()
+        self.assertFalse(hasattr(ctx, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ctx.bad_attribute = None  # type: ignore[attr-defined]
+
     def test_get_stream(self) -> None:
         stream = _ExampleTextIOClass()
         stream.write("Testing")
         stream.write("More testing.")
-        text = lg.CaptureOutputResult.get_stream(stream)
+        text = lg.CaptureOutputResult.get_stream(stream)  # type: ignore[arg-type]
         self.assertEqual(text, "Testing\nMore testing.")
 
 
@@ -161,13 +96,16 @@ class Test_consecutive(unittest.TestCase):
         Nominal consecutive enum
         Unique, but not consecutive
         Not unique
+        Empty
+        Already validated
     """
 
     def setUp(self) -> None:
         self.enum = lg.IntEnumPlus("Enum1", "one two three")  # type: ignore[call-overload]
 
     def test_consecutive(self) -> None:
-        enum = lg.consecutive(_Example_Consecutive)
+        enum = lg.IntEnumPlus("_Example_Consecutive", [("zero", 0), ("one", 1), ("two", 2)])  # type: ignore[call-overload]
+        enum = lg.consecutive(enum)
         self.assertTrue(isinstance(enum, lg.enums._EnumMetaPlus))
 
     def test_consecutive_but_not_zero(self) -> None:
@@ -176,15 +114,27 @@ class Test_consecutive(unittest.TestCase):
         self.assertEqual(str(context.exception), "Bad starting value (should be zero): 1")
 
     def test_unique_but_non_consecutive(self) -> None:
+        enum = lg.IntEnumPlus("_Example_Consecutive2", [("zero", 0), ("one", 1), ("skip", 9)])  # type: ignore[call-overload]
         with self.assertRaises(ValueError) as context:
-            lg.consecutive(_Example_Consecutive2)
+            lg.consecutive(enum)
         self.assertEqual(str(context.exception), "Non-consecutive values found in _Example_Consecutive2: skip: 9")
 
     def test_not_unique(self) -> None:
+        enum = lg.IntEnumPlus("_Example_Consecutive3", [("zero", 0), ("one", 1), ("dup", 0)])  # type: ignore[call-overload]
         with self.assertRaises(ValueError) as context:
-            lg.consecutive(_Example_Consecutive3)
+            lg.consecutive(enum)
         self.assertEqual(str(context.exception), "Duplicate values found in _Example_Consecutive3: dup -> zero")
 
+    def test_already_validated(self) -> None:
+        enum = lg.consecutive(lg.IntEnumPlus("Enum2", [("zero", 0), ("one", 1)]))  # type: ignore[call-overload]
+        self.assertTrue(enum.__dict__["__slog_consecutive__"])
+        self.assertIs(lg.consecutive(enum), enum)
+
+    def test_empty(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            lg.consecutive(lg.IntEnumPlus("Empty", []))  # type: ignore[call-overload]
+        self.assertEqual(str(context.exception), "No values found in Empty")
+
 
 # %% is_dunder
 class Test_is_dunder(unittest.TestCase):
@@ -215,7 +165,7 @@ class Test_get_root_dir(unittest.TestCase):
     """
 
     def test_function(self) -> None:
-        filepath = inspect.getfile(lg.get_root_dir.__wrapped__)
+        filepath = lg.paths.__file__
         expected_root = pathlib.Path(os.path.split(filepath)[0])
         folder = lg.get_root_dir()
         self.assertEqual(folder, expected_root)
@@ -255,9 +205,13 @@ class Test_capture_output(unittest.TestCase):
         self.assertEqual(error, "Error Raised.")
 
     def test_bad_value(self) -> None:
-        with self.assertRaises(RuntimeError):
+        old_out, old_err = (sys.stdout, sys.stderr)
+        with self.assertRaises(RuntimeError) as context:
             with lg.capture_output("bad"):
                 print("Lost values")  # pragma: no cover
+        self.assertEqual(str(context.exception), 'Unknown mode: "bad"')
+        self.assertIs(sys.stdout, old_out)
+        self.assertIs(sys.stderr, old_err)
 
 
 # %% Unit test execution
@@ -9,20 +9,22 @@ Notes
 
 # %% Imports
 from contextlib import contextmanager
-import doctest
 from io import StringIO
 import sys
 from typing import Any, Callable, Iterator, TextIO, TypeVar
-import unittest
 
 # %% Constants
 _F = TypeVar("_F", bound=Callable[..., Any])
+# capture_output modes, and whether they capture (stdout, stderr)
+_MODES: dict[str, tuple[bool, bool]] = {"out": (True, False), "err": (False, True), "all": (True, True)}
 
 
 # %% Classes
 class CaptureOutputResult:
     r"""Class used to keep track of the standard output and error streams to assist the capture_output function."""
 
+    __slots__ = ("stdout", "stderr")
+
     def __init__(self, stdout: StringIO | TextIO | None = None, stderr: StringIO | TextIO | None = None):
         self.stdout = stdout
         self.stderr = stderr
@@ -49,35 +51,54 @@ class CaptureOutputResult:
         if not std:
             return ""
 
-        if isinstance(std, StringIO):
-            return std.getvalue().strip()
+        # use getvalue if the stream has one (like StringIO), otherwise read all the lines
+        getvalue: Callable[[], str] | None = getattr(std, "getvalue", None)
+        if getvalue is not None:
+            return getvalue().strip()
+        return "\n".join(std.readlines())
+
+
+# %% Functions - _fmt_duplicate
+def _fmt_duplicate(duplicate: tuple[str, str]) -> str:
+    r"""Format an (alias, name) pair for the consecutive error message."""
+    return f"{duplicate[0]} -> {duplicate[1]}"
 
-        if isinstance(std, TextIO):
-            return "\n".join(std.readlines())
 
-        raise Exception(f"Unknown type {type(std)}")  # pylint: disable=broad-exception-raised
+# %% Functions - _fmt_non_consecutive
+def _fmt_non_consecutive(non_consecutive: tuple[str, Any]) -> str:
+    r"""Format a (name, member) pair for the consecutive error message."""
+    return f"{non_consecutive[0]}: {non_consecutive[1].value}"
 
 
 # %% Decorators - consecutive
 def consecutive(enumeration: _F) -> _F:
     r"""Class decorator for enumerations ensuring unique and consecutive member values that start from zero."""
+    # skip classes that have already been validated, as enumerations can't change once created
+    if enumeration.__dict__.get("__slog_consecutive__", False):
+        return enumeration
+    members = enumeration.__members__  # type: ignore[attr-defined]
+    if not members:
+        raise ValueError(f"No values found in {enumeration.__name__}")
+    # members are in definition order, so the first one must be the zero
+    first = next(iter(members.values()))
+    if first != 0:
+        raise ValueError(f"Bad starting value (should be zero): {first.value}")
     duplicates = []
     non_consecutive = []
-    last_value = min(enumeration.__members__.values()) - 1  # type: ignore[attr-defined]
-    if last_value != -1:
-        raise ValueError(f"Bad starting value (should be zero): {last_value + 1}")
-    for name, member in enumeration.__members__.items():  # type: ignore[attr-defined]
+    last_value = -1
+    for name, member in members.items():
         if name != member.name:
             duplicates.append((name, member.name))
         if member != last_value + 1:
             non_consecutive.append((name, member))
         last_value = member
     if duplicates:
-        alias_details = ", ".join([f"{alias} -> {name}" for (alias, name) in duplicates])
+        alias_details = ", ".join(map(_fmt_duplicate, duplicates))
         raise ValueError(f"Duplicate values found in {enumeration.__name__}: {alias_details}")
     if non_consecutive:
-        alias_details = ", ".join(f"{name}: {int(member)}" for (name, member) in non_consecutive)
+        alias_details = ", ".join(map(_fmt_non_consecutive, non_consecutive))
         raise ValueError(f"Non-consecutive values found in {enumeration.__name__}: {alias_details}")
+    setattr(enumeration, "__slog_consecutive__", True)
     return enumeration
 
 
@@ -111,8 +132,9 @@ def is_dunder(name: str) -> bool:
     False
 
     """
-    # Note that this is copied from the enum library, as it is not part of their public API.
-    return len(name) > 4 and name[:2] == name[-2:] == "__" and name[2] != "_" and name[-3] != "_"
+    # Note that this is adapted from the enum library, as it is not part of their public API, but
+    # uses startswith/endswith to reject most names without creating any slices.
+    return len(name) > 4 and name.startswith("__") and name.endswith("__") and name[2] != "_" and name[-3] != "_"
 
 
 # %% Functions - capture_output
@@ -136,6 +158,11 @@ def capture_output(mode: str = "out") -> Iterator[CaptureOutputResult]:
     err : class StringIO
         stderr stream output
 
+    Raises
+    ------
+    RuntimeError
+        If the mode is not valid, which is checked before any streams are replaced
+
     Notes
     -----
     #.  Written by David C. Stauffer in March 2015.
@@ -154,25 +181,23 @@ def capture_output(mode: str = "out") -> Iterator[CaptureOutputResult]:
 
     """
     # alias modes
-    capture_out = mode in {"out", "all"}
-    capture_err = mode in {"err", "all"}
-    # create new string buffers
-    new_out, new_err = StringIO(), StringIO()
+    try:
+        capture_out, capture_err = _MODES[mode]
+    except KeyError:
+        raise RuntimeError(f'Unknown mode: "{mode}"') from None
+    # create new string buffers, only for the streams being captured
+    new_out = StringIO() if capture_out else None
+    new_err = StringIO() if capture_err else None
     # alias the old string buffers for restoration afterwards
     old_out, old_err = sys.stdout, sys.stderr
     try:
         # override the system buffers with the new ones
-        if capture_out:
+        if new_out is not None:
             sys.stdout = new_out
-        if capture_err:
+        if new_err is not None:
             sys.stderr = new_err
         # yield results as desired
-        if mode == "out":
-            yield CaptureOutputResult(stdout=sys.stdout)
-        elif mode == "err":
-            yield CaptureOutputResult(stderr=sys.stderr)
-        elif mode == "all":
-            yield CaptureOutputResult(stdout=sys.stdout, stderr=sys.stderr)
+        yield CaptureOutputResult(stdout=new_out, stderr=new_err)
     finally:
         # restore the original buffers once all results are read
         sys.stdout, sys.stderr = old_out, old_err
@@ -180,5 +205,8 @@ def capture_output(mode: str = "out") -> Iterator[CaptureOutputResult]:
 
 # %% Unit test
 if __name__ == "__main__":
+    import doctest
+    import unittest
+
     unittest.main(module="slog.tests.test_utils", exit=False)
     doctest.testmod(verbose=False)
@@ -8,6 +8,8 @@ Notes
 
 # %% Constants
 version_info = (1, 0, 0)
+version_str = ".".join(str(x) for x in version_info)
+__version__ = version_str
 
 # Below is data about the minor release history for potential use in deprecating older support.
 # For inspiration, see: https://numpy.org/neps/nep-0029-deprecation_policy.html